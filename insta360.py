@@ -49,7 +49,7 @@ import time
 import threading
 
 from google.protobuf import json_format
-from transport import TransportFactory, TransportBase
+from transport import TransportFactory, TransportBase, RxBuffer
 sys.path.append('pb2')
 import capture_state_pb2
 import current_capture_status_pb2
@@ -183,7 +183,7 @@ class camera:
         self.message_seq = 0
         self.sent_messages_codes = {}
         self.rcv_thread = None
-        self.rcv_buffer = b''
+        self.rcv_buffer = RxBuffer()
         self.socket_lock = threading.Lock()  # Initialize lock immediately
         self.is_connected = False
         self.reconnect_time = time.time()
@@ -240,11 +240,13 @@ class camera:
     
     def _transport_receive_callback(self, data: bytes):
         """Callback for transport layer to deliver received data"""
+        # RxBuffer.extend() appends in amortized O(1); no bytes object
+        # is rebuilt per chunk.
         if self.socket_lock:
             with self.socket_lock:
-                self.rcv_buffer += data
+                self.rcv_buffer.extend(data)
         else:
-            self.rcv_buffer += data
+            self.rcv_buffer.extend(data)
 
 
     def Close(self):
@@ -370,33 +372,44 @@ class camera:
                     with self.socket_lock:
                         buffer_len = len(self.rcv_buffer)
                         if buffer_len > 0:
-                            self.logger.debug("Receiving buffer: b'%s'" % (bytes_to_hexascii(self.rcv_buffer,)))
-                        
+                            self.logger.debug("Receiving buffer: b'%s'" % (bytes_to_hexascii(self.rcv_buffer.peek(buffer_len))))
+
                         if pkt_len is None and buffer_len >= 4:
-                            pkt_len = int.from_bytes(self.rcv_buffer[0:4], byteorder='little')
+                            pkt_len = int.from_bytes(self.rcv_buffer.peek(4), byteorder='little')
                             self.logger.debug('Received begin of packet, length = %d' % (pkt_len,))
-                            
+
                         if pkt_len is not None and buffer_len >= pkt_len:
                             self.logger.debug('Packet is complete, len(rcv_buffer): %s' % (buffer_len,))
-                            pkt_data = self.rcv_buffer[4:pkt_len]
-                            self.rcv_buffer = self.rcv_buffer[pkt_len:]
+                            # Copy the packet body out of the memoryview, then
+                            # advance the read index past the whole packet.
+                            pkt_data = bytes(self.rcv_buffer.peek(pkt_len)[4:])
+                            self.rcv_buffer.consume(pkt_len)
                             break
                 else:
                     # No lock available yet
                     if pkt_len is None and len(self.rcv_buffer) >= 4:
-                        pkt_len = int.from_bytes(self.rcv_buffer[0:4], byteorder='little')
-                        
+                        pkt_len = int.from_bytes(self.rcv_buffer.peek(4), byteorder='little')
+
                     if pkt_len is not None and len(self.rcv_buffer) >= pkt_len:
-                        pkt_data = self.rcv_buffer[4:pkt_len]
-                        self.rcv_buffer = self.rcv_buffer[pkt_len:]
+                        pkt_data = bytes(self.rcv_buffer.peek(pkt_len)[4:])
+                        self.rcv_buffer.consume(pkt_len)
                         break
-                    
+
                 # Packet is not complete, wait for more data
                 time.sleep(0.01)  # Small sleep to avoid busy waiting
                 
                 if time.time() - t0 > self.PKT_COMPLETE_TIMEOUT_SEC:
-                    self.logger.warning("Timeout in receive_packet(). Discarding buffer: b'%s'" % (bytes_to_hexascii(self.rcv_buffer),))
-                    self.rcv_buffer = b''  # Clear buffer on timeout
+                    # Copy and clear under the lock: formatting from a live
+                    # peek() memoryview would make a concurrent extend()
+                    # raise BufferError and drop the incoming chunk.
+                    if self.socket_lock:
+                        with self.socket_lock:
+                            discarded = bytes(self.rcv_buffer.peek(len(self.rcv_buffer)))
+                            self.rcv_buffer.clear()  # Clear buffer on timeout
+                    else:
+                        discarded = bytes(self.rcv_buffer.peek(len(self.rcv_buffer)))
+                        self.rcv_buffer.clear()  # Clear buffer on timeout
+                    self.logger.warning("Timeout in receive_packet(). Discarding buffer: b'%s'" % (bytes_to_hexascii(discarded),))
                     break
                     
             # The packet is complete or receiving complete packet timeout.
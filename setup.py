@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+"""
+Build the optional C-accelerated receive path (transport_ext.pyx).
+
+The extension is not required: transport.py falls back to its
+pure-Python receive loop when transport_ext is not importable.
+
+  pip3 install cython
+  python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name='insta360-transport-ext',
+    ext_modules=cythonize('transport_ext.pyx'),
+)
@@ -9,14 +9,22 @@ This module provides a unified interface for different transport mechanisms
 from abc import ABC, abstractmethod
 import asyncio
 import logging
+import queue
 import socket
 import struct
 import threading
 import time
-from typing import Optional, Callable, Tuple
+from typing import Iterable, Optional, Callable, Tuple
 
 import select
 
+try:
+    # Optional C-accelerated receive loop; see transport_ext.pyx and
+    # setup.py. Pure-Python fallback is used when it is not built.
+    from transport_ext import RxDrain as _RxDrain
+except ImportError:
+    _RxDrain = None
+
 __author__ = "Niccolo Rigacci"
 __copyright__ = "Copyright 2024 Niccolo Rigacci <niccolo@rigacci.org>"
 __license__ = "GPLv3-or-later"
@@ -24,13 +32,91 @@ __email__ = "niccolo@rigacci.org"
 __version__ = "0.2.0"
 
 
+def _noop_receive_callback(data: bytes) -> None:
+    """Default receive callback: discard data until a real one is set."""
+    pass
+
+
+# Process-wide pool of receive buffers, shared by all transport
+# instances. A buffer is borrowed for the duration of one read and
+# returned once the data has been delivered downstream, so memory use
+# is bounded by the number of concurrent in-flight reads instead of
+# growing with the total number of reads.
+_BUF_POOL_SIZE = 65536
+_BUF_POOL_MAX = 8
+_buf_pool: queue.LifoQueue = queue.LifoQueue()
+
+
+def _buf_pool_acquire() -> bytearray:
+    """Borrow a buffer from the pool, allocating one if it is empty."""
+    try:
+        return _buf_pool.get_nowait()
+    except queue.Empty:
+        return bytearray(_BUF_POOL_SIZE)
+
+
+def _buf_pool_release(buf: bytearray) -> None:
+    """Return a buffer to the pool, dropping it if the pool is full."""
+    if _buf_pool.qsize() < _BUF_POOL_MAX:
+        _buf_pool.put_nowait(buf)
+
+
+class RxBuffer:
+    """Reassembly buffer for framed protocol data.
+
+    Chunks from the transport are appended with extend(); the parser
+    inspects pending data through peek(), which returns a memoryview
+    into the buffer, and advances a read index with consume(). Compared
+    to rebuilding a bytes object per packet (buf += chunk followed by
+    buf = buf[n:]), which is O(n^2) over a multi-chunk message, this
+    appends in amortized O(1) and only compacts the consumed prefix
+    away once it grows past a threshold.
+    """
+
+    COMPACT_THRESHOLD = 65536
+
+    def __init__(self):
+        self._buf = bytearray()
+        self._read = 0
+
+    def __len__(self) -> int:
+        """Number of unread bytes."""
+        return len(self._buf) - self._read
+
+    def extend(self, data) -> None:
+        """Append a received chunk (bytes, bytearray or memoryview)."""
+        self._buf.extend(data)
+
+    def peek(self, nbytes: int) -> memoryview:
+        """View of up to nbytes of unread data, without consuming it.
+
+        The view is only valid until the next extend() or consume();
+        callers that need to keep the data must copy it with bytes().
+        """
+        return memoryview(self._buf)[self._read:self._read + nbytes]
+
+    def consume(self, nbytes: int) -> None:
+        """Advance the read index past nbytes of parsed data."""
+        self._read = min(self._read + nbytes, len(self._buf))
+        if self._read == len(self._buf) or self._read >= self.COMPACT_THRESHOLD:
+            del self._buf[:self._read]
+            self._read = 0
+
+    def clear(self) -> None:
+        """Discard all buffered data."""
+        self._buf.clear()
+        self._read = 0
+
+
 class TransportBase(ABC):
     """Abstract base class for all transport implementations."""
-    
+
     def __init__(self, logger: Optional[logging.Logger] = None):
         self.logger = logger or logging.getLogger(__name__)
         self.is_connected = False
-        self.receive_callback: Optional[Callable[[bytes], None]] = None
+        # Always-callable default, so per-packet code can dispatch
+        # without a None check.
+        self.receive_callback: Callable[[bytes], None] = _noop_receive_callback
         
     @abstractmethod
     def connect(self, **kwargs) -> bool:
@@ -46,7 +132,19 @@ class TransportBase(ABC):
     def send(self, data: bytes) -> bool:
         """Send raw data to the camera. Returns True on success."""
         pass
-    
+
+    def send_many(self, parts: Iterable[bytes]) -> bool:
+        """Join several fragments and send them as one write.
+
+        Callers that build a packet as header + body should use this
+        instead of calling send() per fragment, so the per-send overhead
+        (thread hop, lock, ATT transaction) is paid once. For BLE
+        write-without-response the joined size must stay within MTU-3
+        bytes (typically ~244); larger payloads should be chunked by the
+        caller.
+        """
+        return self.send(b''.join(parts))
+
     @abstractmethod
     def start_receiving(self, callback: Callable[[bytes], None]) -> None:
         """Start receiving data asynchronously. Callback receives raw bytes."""
@@ -75,22 +173,70 @@ class WiFiTransport(TransportBase):
         self.host: Optional[str] = None
         self.port: Optional[int] = None
         self.socket: Optional[socket.socket] = None
-        self.socket_lock = threading.Lock()
-        self.rcv_thread: Optional[threading.Thread] = None
         self.rcv_buffer = b''
-        self.stop_receiving_flag = False
+        # Receiving is driven by an asyncio loop in a background thread
+        # (same model as BLETransport) watching the socket fd, instead
+        # of a dedicated polling thread.
+        self.event_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.loop_thread: Optional[threading.Thread] = None
+        self._loop_ready = threading.Event()
+        self._rx_drain = None  # transport_ext.RxDrain when the extension is built
+        # Writer serialization: sock_sendall() can suspend mid-frame on a
+        # partial write, so concurrent senders need a lock to keep their
+        # frames from interleaving on the wire. The asyncio lock guards
+        # sends on the event loop (created per loop in start_receiving);
+        # the threading lock guards the direct path used before it starts.
+        self._send_lock = threading.Lock()
+        self._send_async_lock: Optional[asyncio.Lock] = None
         
-    def connect(self, host: str = '192.168.42.1', port: int = 6666, **kwargs) -> bool:
-        """Connect to camera via TCP socket."""
+    def connect(self, host: str = '192.168.42.1', port: int = 6666,
+                busy_poll_us: int = 0, **kwargs) -> bool:
+        """Connect to camera via TCP socket.
+
+        busy_poll_us > 0 enables SO_BUSY_POLL (Linux only): the kernel
+        busy-polls the NIC for that many microseconds before sleeping,
+        cutting wakeup latency for time-critical commands at the cost of
+        burning CPU. Leave at 0 unless sub-millisecond latency matters.
+        """
         try:
             self.host = host
             self.port = port
             
             self.logger.info(f'WiFi: Connecting to {host}:{port}')
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # Disable Nagle's algorithm: the protocol exchanges small
+            # command frames and waiting for ACK coalescing can stall
+            # each request by tens of milliseconds.
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # Enlarge the socket buffers so bursty preview/stream frames
+            # do not close the TCP window. Request 2 MiB; the kernel may
+            # cap it (net.core.rmem_max/wmem_max), so log the effective
+            # size it granted.
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 21)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 21)
+            self.logger.debug(
+                'WiFi: Socket buffers: SO_RCVBUF=%d SO_SNDBUF=%d' % (
+                    self.socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF),
+                    self.socket.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF)))
+            if busy_poll_us > 0:
+                if hasattr(socket, 'SO_BUSY_POLL'):
+                    try:
+                        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_BUSY_POLL, busy_poll_us)
+                        self.logger.debug(f'WiFi: SO_BUSY_POLL set to {busy_poll_us}us')
+                    except OSError as e:
+                        # Values above net.core.busy_read need CAP_NET_ADMIN;
+                        # degrade to normal polling rather than failing connect.
+                        self.logger.warning(f'WiFi: SO_BUSY_POLL not applied: {e}')
+                else:
+                    self.logger.warning('WiFi: SO_BUSY_POLL not supported on this platform')
             self.socket.settimeout(self.SOCKET_TIMEOUT_SEC)
             self.socket.connect((host, port))
-            
+            # Nonblocking from here on: the receive loop drains the
+            # kernel buffer until EAGAIN on each poller wakeup and
+            # send() waits for writability explicitly.
+            self.socket.setblocking(False)
+
             self.is_connected = True
             self.logger.debug('WiFi: Socket connected')
             return True
@@ -110,71 +256,176 @@ class WiFiTransport(TransportBase):
             try:
                 self.socket.shutdown(socket.SHUT_RDWR)
                 self.socket.close()
-            except:
-                pass
+            except Exception as e:
+                self.logger.debug(f'WiFi: Socket close ignored: {e}')
             self.socket = None
             
         self.is_connected = False
         self.rcv_buffer = b''
         
     def send(self, data: bytes) -> bool:
-        """Send data through the socket."""
+        """Send data through the socket (synchronous wrapper).
+
+        Sends run on the event loop, serialized by a lock so concurrent
+        callers cannot interleave frames; code already on the loop
+        should await send_async() instead.
+        """
         if not self.socket or not self.is_connected:
             return False
-            
+
+        if self.event_loop is None:
+            # Receiving not started yet: write directly from this thread.
+            try:
+                with self._send_lock:
+                    self._sendall(data)
+                return True
+            except Exception as e:
+                self.logger.error(f'WiFi: Send failed: {e}')
+                return False
+
+        try:
+            future = asyncio.run_coroutine_threadsafe(self.send_async(data), self.event_loop)
+            return future.result(timeout=self.SOCKET_TIMEOUT_SEC)
+        except Exception as e:
+            self.logger.error(f'WiFi: Send failed: {e}')
+            return False
+
+    async def send_async(self, data: bytes) -> bool:
+        """Send data from code already running on the event loop.
+
+        Tasks interleave at await points and sock_sendall() awaits on a
+        partial write, so writers hold an asyncio.Lock for the whole
+        frame to keep concurrent sends from corrupting the stream.
+        """
         try:
-            with self.socket_lock:
-                self.socket.sendall(data)
+            async with self._send_async_lock:
+                await asyncio.get_running_loop().sock_sendall(self.socket, data)
             return True
         except Exception as e:
             self.logger.error(f'WiFi: Send failed: {e}')
             return False
+
+    def _sendall(self, data: bytes) -> None:
+        """sendall() for the nonblocking socket: wait for writability on EAGAIN.
+
+        Raises socket.timeout if the socket stays unwritable for
+        SOCKET_TIMEOUT_SEC, matching the old blocking sendall() behavior.
+        """
+        view = memoryview(data)
+        while view:
+            try:
+                sent = self.socket.send(view)
+                view = view[sent:]
+            except BlockingIOError:
+                _, writable, _ = select.select([], [self.socket], [], self.SOCKET_TIMEOUT_SEC)
+                if not writable:
+                    raise socket.timeout('not writable within %.1fs' % (self.SOCKET_TIMEOUT_SEC,))
     
     def start_receiving(self, callback: Callable[[bytes], None]) -> None:
-        """Start the receiving thread."""
-        if self.rcv_thread and self.rcv_thread.is_alive():
+        """Start receiving by watching the socket fd on the event loop."""
+        if self.event_loop is not None:
             return
-            
+
         self.receive_callback = callback
-        self.stop_receiving_flag = False
-        self.rcv_thread = threading.Thread(target=self._receive_loop, daemon=True)
-        self.rcv_thread.start()
-        
+        # Fresh lock per loop: an asyncio.Lock binds to the loop it is
+        # first awaited on, which breaks across a reconnect otherwise.
+        self._send_async_lock = asyncio.Lock()
+        self._loop_ready.clear()
+        self.loop_thread = threading.Thread(target=self._run_event_loop, daemon=True)
+        self.loop_thread.start()
+        if not self._loop_ready.wait(timeout=2.0):
+            self.logger.error('WiFi: Event loop failed to start')
+            return
+        # Register the fd with the loop's selector; the loop invokes the
+        # readable handler whenever data is pending, with no polling
+        # thread and no per-tick poller setup. Use the C drain loop when
+        # the transport_ext extension is built.
+        if _RxDrain is not None:
+            self._rx_drain = _RxDrain(self.socket.fileno(), self.receive_callback)
+            reader = self._on_readable_ext
+        else:
+            reader = self._on_readable
+        self.event_loop.call_soon_threadsafe(
+            self.event_loop.add_reader, self.socket.fileno(), reader)
+
     def stop_receiving(self) -> None:
-        """Stop the receiving thread."""
-        self.stop_receiving_flag = True
-        if self.rcv_thread:
-            self.rcv_thread.join(timeout=2.0)
-            self.rcv_thread = None
-            
-    def _receive_loop(self) -> None:
-        """Receiving thread main loop."""
-        while not self.stop_receiving_flag and self.socket:
-            if not self._poll_and_receive():
-                time.sleep(0.1)
-                
-    def _poll_and_receive(self) -> bool:
-        """Poll socket and receive data. Returns True if data was received."""
-        if not self.socket:
-            return False
-            
+        """Unregister the socket fd and stop the event loop thread."""
+        if self.event_loop is None:
+            return
+        fd = self.socket.fileno() if self.socket else -1
+        loop = self.event_loop
+
+        def teardown():
+            if fd >= 0:
+                try:
+                    loop.remove_reader(fd)
+                except Exception:
+                    pass
+            loop.stop()
+
+        loop.call_soon_threadsafe(teardown)
+        if self.loop_thread:
+            self.loop_thread.join(timeout=2.0)
+            self.loop_thread = None
+        self.event_loop = None
+
+    def _run_event_loop(self) -> None:
+        """Run the asyncio event loop in a separate thread."""
+        self.event_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.event_loop)
+        self._loop_ready.set()
+        self.event_loop.run_forever()
+
+    def _on_readable(self) -> None:
+        """Event loop callback: drain the socket until EAGAIN.
+
+        recv_into() fills a buffer borrowed from the shared pool; the
+        callback receives a memoryview into it and must copy anything it
+        wants to keep, because the buffer goes back to the pool as soon
+        as this handler returns.
+        """
+        buf = _buf_pool_acquire()
+        mv = memoryview(buf)
         try:
-            poller = select.poll()
-            poller.register(self.socket, select.POLLIN)
-            events = poller.poll(100)  # 100ms timeout
-            
-            for sock, event in events:
-                if event & select.POLLIN and sock == self.socket.fileno():
-                    data = self.socket.recv(4096)
-                    if data and self.receive_callback:
-                        self.receive_callback(data)
-                    return True
-                    
+            while True:
+                try:
+                    nbytes = self.socket.recv_into(mv, len(mv))
+                except BlockingIOError:
+                    return
+                except Exception as e:
+                    self.logger.error(f'WiFi: Receive error: {e}')
+                    return
+                if nbytes == 0:
+                    # Peer closed the connection; stop watching the fd.
+                    try:
+                        self.event_loop.remove_reader(self.socket.fileno())
+                    except Exception:
+                        pass
+                    self.is_connected = False
+                    return
+                self.receive_callback(mv[:nbytes])
+        finally:
+            mv.release()
+            _buf_pool_release(buf)
+
+    def _on_readable_ext(self) -> None:
+        """Event loop callback backed by the transport_ext C drain loop.
+
+        The extension reads until EAGAIN with a C-level buffer and calls
+        the receive callback with bytes chunks, so only connection-close
+        and errors are handled here.
+        """
+        try:
+            if self._rx_drain.drain() < 0:
+                # Peer closed the connection; stop watching the fd.
+                try:
+                    self.event_loop.remove_reader(self.socket.fileno())
+                except Exception:
+                    pass
+                self.is_connected = False
         except Exception as e:
             self.logger.error(f'WiFi: Receive error: {e}')
-            
-        return False
-    
+
     @property
     def connection_info(self) -> str:
         """Return connection information."""
@@ -188,11 +439,15 @@ class BLETransport(TransportBase):
     
     # BLE UUIDs
     SERVICE_UUID = "0000be80-0000-1000-8000-00805f9b34fb"
+    SERVICE_UUID_LC = SERVICE_UUID.lower()  # Precomputed for per-advertisement matching
     WRITE_CHAR_UUID = "0000be81-0000-1000-8000-00805f9b34fb"  # write, read
     READ_CHAR_UUID = "0000be82-0000-1000-8000-00805f9b34fb"   # notify
     
-    def __init__(self, logger: Optional[logging.Logger] = None):
+    def __init__(self, logger: Optional[logging.Logger] = None, send_batch_size: int = 8):
         super().__init__(logger)
+        # How many queued writes may go out as write-without-response
+        # before a write-with-response sync point flushes the batch.
+        self.send_batch_size = max(1, send_batch_size)
         self.device_address: Optional[str] = None
         self.device_name: Optional[str] = None
         self.client = None  # BleakClient instance
@@ -202,6 +457,15 @@ class BLETransport(TransportBase):
         self._disconnect_future: Optional[asyncio.Future] = None
         self._pending_tasks: set = set()  # Track pending async tasks
         self._disconnecting = False  # Flag to prevent new operations during disconnect
+        # Notification accumulator for the pull API: a list of chunks is
+        # appended in O(1) per notification and joined lazily, instead of
+        # concatenating bytes per packet which is O(n^2) over a message.
+        self._chunks: list = []
+        self._chunks_len = 0
+        self._chunks_lock = threading.Lock()
+        self._send_queue: Optional[asyncio.Queue] = None
+        self._send_pump_task = None
+        self._loop_ready = threading.Event()
         
     def connect(self, device_address: Optional[str] = None, scan_timeout: float = None, **kwargs) -> bool:
         """Connect to camera via BLE."""
@@ -210,11 +474,15 @@ class BLETransport(TransportBase):
             from bleak import BleakClient, BleakScanner
             
             # Start event loop in separate thread
+            self._loop_ready.clear()
             self.ble_thread = threading.Thread(target=self._run_event_loop, daemon=True)
             self.ble_thread.start()
-            
-            # Wait for event loop to start
-            time.sleep(0.1)
+
+            # Wait for the event loop to be created; signaled by
+            # _run_event_loop instead of sleeping a fixed 100ms.
+            if not self._loop_ready.wait(timeout=2.0):
+                self.logger.error('BLE: Event loop failed to start')
+                return False
             
             # Submit connection task
             future = asyncio.run_coroutine_threadsafe(
@@ -250,8 +518,8 @@ class BLETransport(TransportBase):
             )
             try:
                 future.result(timeout=5.0)
-            except:
-                pass
+            except Exception as e:
+                self.logger.debug(f'BLE: Disconnect error ignored: {e}')
         
         # Cancel all pending tasks
         if self.event_loop:
@@ -275,13 +543,18 @@ class BLETransport(TransportBase):
         self._disconnecting = False
             
     def send(self, data: bytes) -> bool:
-        """Send data via BLE."""
+        """Send data via BLE (synchronous wrapper).
+
+        This hops onto the background event loop and blocks until the
+        write completes. Code that already runs on the event loop should
+        `await send_async()` directly and skip the thread hand-off.
+        """
         if not self.client or not self.is_connected or not self.event_loop or self._disconnecting:
             return False
-        
+
         try:
             future = asyncio.run_coroutine_threadsafe(
-                self._async_send(data),
+                self.send_async(data),
                 self.event_loop
             )
             return future.result(timeout=2.0)
@@ -296,14 +569,29 @@ class BLETransport(TransportBase):
         
     def stop_receiving(self) -> None:
         """BLE notifications are stopped automatically on disconnect."""
-        self.receive_callback = None
+        self.receive_callback = _noop_receive_callback
+        with self._chunks_lock:
+            self._chunks.clear()
+            self._chunks_len = 0
         
     def _run_event_loop(self) -> None:
         """Run the asyncio event loop in a separate thread."""
         self.event_loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.event_loop)
+        self._loop_ready.set()
         self.event_loop.run_forever()
-        
+
+    def _track_task(self, coro) -> asyncio.Task:
+        """Create a task and track it so disconnect() can cancel it.
+
+        The done callback removes the task again, so _pending_tasks only
+        ever holds tasks that are actually still running.
+        """
+        task = asyncio.create_task(coro)
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._pending_tasks.discard)
+        return task
+
     async def _async_connect(self, device_address: Optional[str], scan_timeout: Optional[float]) -> bool:
         """Async connect implementation."""
         from bleak import BleakClient, BleakScanner
@@ -343,6 +631,9 @@ class BLETransport(TransportBase):
                 self.logger.info(f'BLE: Connected to device, enabling notifications')
                 # Enable notifications
                 await self.client.start_notify(self.READ_CHAR_UUID, self._notification_handler)
+                # Start the queued sender; see _send_pump().
+                self._send_queue = asyncio.Queue()
+                self._send_pump_task = self._track_task(self._send_pump())
                 self.is_connected = True
                 self.logger.info(f'BLE: Successfully connected to {self.device_name or device_address}')
                 return True
@@ -358,19 +649,86 @@ class BLETransport(TransportBase):
     
     async def _async_disconnect(self) -> None:
         """Async disconnect implementation."""
+        if self._send_pump_task is not None:
+            self._send_pump_task.cancel()
+            self._send_pump_task = None
+        if self._send_queue is not None:
+            # The pump's finally never runs if it was cancelled before
+            # its first scheduling; release queued senders here as well.
+            while not self._send_queue.empty():
+                _, result = self._send_queue.get_nowait()
+                if not result.done():
+                    result.set_result(False)
+            self._send_queue = None
+        # Let tracked tasks (send pump, half-finished scanner stops)
+        # actually finish cancelling; a zombie scan task can keep the
+        # BLE stack busy and delay the next connect.
+        if self._pending_tasks:
+            await asyncio.gather(*list(self._pending_tasks), return_exceptions=True)
         if self.client and self.client.is_connected:
             try:
                 await self.client.stop_notify(self.READ_CHAR_UUID)
                 await self.client.disconnect()
-            except:
-                pass
+            except Exception as e:
+                self.logger.debug(f'BLE: Stop notify/disconnect ignored: {e}')
             
-    async def _async_send(self, data: bytes) -> bool:
-        """Async send implementation."""
+    async def send_async(self, data: bytes) -> bool:
+        """Send data via BLE from code already running on the event loop.
+
+        Awaiting this directly avoids the per-send thread hop and Future
+        round-trip that the sync send() wrapper pays. The write is queued
+        and issued by _send_pump(), so bursts of commands are batched;
+        the returned result is the actual write outcome (for a mid-batch
+        write-without-response, acceptance by the local BLE stack).
+        """
+        if self._disconnecting or not self.client or not self.client.is_connected:
+            return False
+        if self._send_queue is None:
+            # Pump not running (e.g. not fully connected yet): write directly.
+            return await self._write_gatt(data, response=True)
+        # Queue the write together with a future the pump resolves with
+        # the write result, so failures reach the caller.
+        result = asyncio.get_running_loop().create_future()
+        await self._send_queue.put((data, result))
+        return await result
+
+    async def _send_pump(self) -> None:
+        """Drain queued writes, batching with write-without-response.
+
+        A write-with-response waits for the ATT acknowledgment, capping
+        throughput at one write per connection interval. While more data
+        is queued the pump uses write-without-response, falling back to a
+        write-with-response sync point when the queue drains or after
+        every send_batch_size writes. Each queued item carries its
+        sender's future, resolved with the write result so send() and
+        send_async() report failures instead of only logging them.
+        """
+        send_queue = self._send_queue
+        sent_unacked = 0
+        try:
+            while not self._disconnecting:
+                data, result = await send_queue.get()
+                # Ack when the burst is over or the batch budget is spent.
+                want_ack = send_queue.empty() or sent_unacked + 1 >= self.send_batch_size
+                ok = await self._write_gatt(data, response=want_ack)
+                if not result.done():
+                    result.set_result(ok)
+                sent_unacked = 0 if (want_ack or not ok) else sent_unacked + 1
+        except asyncio.CancelledError:
+            pass
+        finally:
+            # Fail anything still queued so blocked senders don't hang.
+            while not send_queue.empty():
+                _, result = send_queue.get_nowait()
+                if not result.done():
+                    result.set_result(False)
+
+    async def _write_gatt(self, data: bytes, response: bool) -> bool:
+        """Issue a single GATT write, logging failures."""
         try:
             if self._disconnecting or not self.client or not self.client.is_connected:
                 return False
-            await self.client.write_gatt_char(self.WRITE_CHAR_UUID, data)
+            await self.client.write_gatt_char(self.WRITE_CHAR_UUID, data, response=response)
             return True
         except asyncio.CancelledError:
             # Task was cancelled during disconnect - this is expected
@@ -390,27 +748,28 @@ class BLETransport(TransportBase):
             devices = await BleakScanner.discover(timeout=timeout, return_adv=True)
             
             for device, adv_data in devices.values():
-                service_uuids = [uuid.lower() for uuid in adv_data.service_uuids]
-                if self.SERVICE_UUID.lower() in service_uuids:
+                # Generator + short-circuit: no list built per advertisement.
+                if self.SERVICE_UUID_LC in (uuid.lower() for uuid in adv_data.service_uuids):
                     self.logger.info(f'BLE: Found {device.name} ({device.address})')
                     return device
             return None
         else:
             # Continuous scanning until device found
             found_device = None
+            found_event = asyncio.Event()
             scanner = None
-            
+
             def detection_callback(device, adv_data):
                 nonlocal found_device, scanner
                 # Only log if we haven't found a device yet
                 if found_device is None:
-                    service_uuids = [uuid.lower() for uuid in adv_data.service_uuids]
-                    if self.SERVICE_UUID.lower() in service_uuids:
+                    if self.SERVICE_UUID_LC in (uuid.lower() for uuid in adv_data.service_uuids):
                         self.logger.info(f'BLE: Found {device.name} ({device.address})')
                         found_device = device
+                        found_event.set()
                         # Stop scanning immediately when device is found
                         if scanner:
-                            asyncio.create_task(scanner.stop())
+                            self._track_task(scanner.stop())
                     
             # Keep scanning in chunks until we find a device
             scan_duration = 5.0  # Max scan duration per attempt
@@ -423,12 +782,14 @@ class BLETransport(TransportBase):
                     
                 scanner = BleakScanner(detection_callback=detection_callback)
                 await scanner.start()
-                
-                # Wait for device to be found or timeout
-                start_time = asyncio.get_event_loop().time()
-                while found_device is None and (asyncio.get_event_loop().time() - start_time) < scan_duration:
-                    await asyncio.sleep(0.1)
-                
+
+                # Wait for the detection callback to signal a find; no
+                # polling, the event wakes this coroutine immediately.
+                try:
+                    await asyncio.wait_for(found_event.wait(), timeout=scan_duration)
+                except asyncio.TimeoutError:
+                    pass
+
                 await scanner.stop()
                 
                 if found_device:
@@ -438,9 +799,49 @@ class BLETransport(TransportBase):
     
     def _notification_handler(self, sender, data: bytes) -> None:
         """Handle BLE notifications."""
-        if self.receive_callback:
+        if self.receive_callback is not _noop_receive_callback:
+            # Compatibility path: deliver each notification as it arrives.
             self.receive_callback(data)
-            
+        else:
+            # Pull path: buffer chunks for pending()/peek()/consume().
+            with self._chunks_lock:
+                self._chunks.append(bytes(data))
+                self._chunks_len += len(data)
+
+    def pending(self) -> int:
+        """Return the number of buffered notification bytes."""
+        return self._chunks_len
+
+    def peek(self, nbytes: int) -> bytes:
+        """Return up to nbytes of buffered data without consuming it."""
+        with self._chunks_lock:
+            if not self._chunks:
+                return b''
+            if len(self._chunks) > 1:
+                # Compact lazily, so appends stay O(1) per notification.
+                self._chunks = [b''.join(self._chunks)]
+            return self._chunks[0][:nbytes]
+
+    def consume(self, nbytes: int) -> bytes:
+        """Remove and return up to nbytes of buffered data."""
+        # Join, slice and account under one lock acquisition: going
+        # through peek() and re-locking would let a notification slip in
+        # between and be destroyed by the empty-chunk cleanup.
+        with self._chunks_lock:
+            if not self._chunks:
+                return b''
+            if len(self._chunks) > 1:
+                # Compact lazily, so appends stay O(1) per notification.
+                self._chunks = [b''.join(self._chunks)]
+            data = self._chunks[0][:nbytes]
+            if data:
+                self._chunks[0] = self._chunks[0][len(data):]
+                self._chunks_len -= len(data)
+                if not self._chunks[0]:
+                    del self._chunks[0]
+            return data
+
+
     @property
     def connection_info(self) -> str:
         """Return connection information."""
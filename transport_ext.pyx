@@ -0,0 +1,58 @@
+# cython: language_level=3
+# -*- coding: utf-8 -*-
+"""
+Optional C-accelerated receive path for transport.py.
+
+The per-packet hot path of WiFiTransport (drain the nonblocking socket
+until EAGAIN, hand each chunk to the receive callback) is rewritten
+here with a C-level read() loop and a stack-allocated buffer, removing
+the CPython attribute lookups, method dispatch and exception machinery
+that dominate at high packet rates. transport.py imports RxDrain if
+this module has been built and silently falls back to the pure-Python
+loop otherwise.
+
+Build in place with:
+
+  python setup.py build_ext --inplace
+"""
+
+from libc.errno cimport errno, EAGAIN, EINTR
+from posix.unistd cimport read as c_read
+
+# Not exported by Cython's libc.errno pxd; pull it from the C header.
+cdef extern from "<errno.h>":
+    int EWOULDBLOCK
+
+
+cdef class RxDrain:
+    """Drain a nonblocking socket fd, delivering chunks to a callback.
+
+    drain() returns the number of bytes delivered, or -1 if the peer
+    closed the connection. The callback receives each chunk as bytes.
+    """
+
+    cdef int fd
+    cdef object callback
+    cdef char buf[65536]
+
+    def __init__(self, int fd, object callback):
+        self.fd = fd
+        self.callback = callback
+
+    def drain(self):
+        cdef Py_ssize_t total = 0
+        cdef Py_ssize_t nbytes
+        while True:
+            nbytes = c_read(self.fd, self.buf, sizeof(self.buf))
+            if nbytes > 0:
+                total += nbytes
+                self.callback(self.buf[:nbytes])
+            elif nbytes == 0:
+                # Peer closed the connection.
+                return -1
+            else:
+                if errno == EAGAIN or errno == EWOULDBLOCK:
+                    return total
+                if errno == EINTR:
+                    continue
+                raise OSError(errno, 'recv failed')